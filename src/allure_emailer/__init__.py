@@ -8,11 +8,20 @@ which defines a Typer application with ``init`` and ``send``
 commands.
 """
 
-from importlib.metadata import version, PackageNotFoundError
 
-try:
-    __version__ = version("allure-emailer")
-except PackageNotFoundError:  # pragma: no cover - package not installed
-    __version__ = "0.0.0"
+def __getattr__(name: str) -> str:
+    # ``importlib.metadata`` is comparatively slow to import, so the
+    # version is only looked up when ``__version__`` is first accessed.
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        value = version("allure-emailer")
+    except PackageNotFoundError:  # pragma: no cover - package not installed
+        value = "0.0.0"
+    globals()["__version__"] = value
+    return value
+
 
 __all__ = ["__version__"]
\ No newline at end of file
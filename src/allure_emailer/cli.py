@@ -15,8 +15,7 @@ import typer
 from pathlib import Path
 from typing import Optional, List, Dict
 
-from .config import Config, save_env_file
-from .emailer import build_html_email, parse_summary, send_email
+from .config import Config, load_env_values, save_env_file
 
 
 # Create the Typer application
@@ -151,7 +150,13 @@ def init(
         }
     )
 
-    env_dir = Path(directory).expanduser().resolve()
+    # Only expand ``~`` and resolve relative paths; an absolute path is
+    # used as given to avoid resolving every component's symlinks.
+    env_dir = Path(directory)
+    if directory.startswith("~"):
+        env_dir = env_dir.expanduser()
+    if not env_dir.is_absolute():
+        env_dir = env_dir.resolve()
     env_path = env_dir / ".env"
     alt_path = env_dir / ".env.emailer"
     # Determine destination: if .env exists and is not empty, write to .env.emailer
@@ -210,6 +215,16 @@ def send(
             "to the full email address."
         ),
     ),
+    smtp_ssl: Optional[bool] = typer.Option(
+        None,
+        "--smtp-ssl/--no-smtp-ssl",
+        help=(
+            "Connect with implicit TLS (SSL) instead of STARTTLS.  Always"
+            " used on port 465; set this for servers offering implicit TLS"
+            " on another port."
+        ),
+        show_default=False,
+    ),
     subject: str = typer.Option(
         "Allure Test Summary",
         help=(
@@ -263,11 +278,12 @@ def send(
     exists) and `.env`.  A warning is printed if both files are
     present, indicating which one will be used.  The SMTP username
     must be a full email address and will be used as the default
-    sender (``From``) address.  Connections on port ``465`` are made
-    using SSL; all other ports (e.g. ``587``) use STARTTLS.  You can
-    override the subject line with ``--subject`` and insert
-    additional custom fields into the body using ``--field KEY=VALUE``
-    or by defining ``AEMAILER_FIELD_<KEY>=VALUE`` entries in your
+    sender (``From``) address.  Connections on port ``465`` (or with
+    ``--smtp-ssl``) are made using SSL; all other ports (e.g.
+    ``587``) use STARTTLS.  You can override the subject line with
+    ``--subject`` and insert additional custom fields into the body
+    using ``--field KEY=VALUE`` or by defining
+    ``AEMAILER_FIELD_<KEY>=VALUE`` entries in your
     configuration file.  (Legacy ``FIELD_<KEY>`` entries are still
     recognised for backward compatibility.)  If you wish to use
     OAuth 2.0 for authentication (for example, with Gmail or Office 365),
@@ -282,6 +298,9 @@ def send(
     provided via command‑line options, the tool will authenticate
     against Microsoft and send the message using Graph instead of SMTP.
     """
+    # Imported here so that ``init`` does not pay for the mail stack
+    from .emailer import build_html_email, parse_summary, send_email
+
     # Determine which env file to load if not explicitly provided
     selected_env = env_file
     if env_file is None:
@@ -310,6 +329,7 @@ def send(
         "report_url": report_url,
         # Support overriding the OAuth token on the CLI
         "oauth_token": oauth_token,
+        "smtp_ssl": None if smtp_ssl is None else ("true" if smtp_ssl else "false"),
         # Graph API overrides
         "tenant_id": tenant_id,
         "client_id": client_id,
@@ -326,11 +346,9 @@ def send(
     # precedence over legacy entries if the same key appears twice.
     custom_fields: Dict[str, str] = {}
     if selected_env:
-        # parse file vars using dotenv_values
-        from dotenv import dotenv_values  # imported lazily to avoid overhead
-
+        # Parsed file values are cached, so re-reading here is cheap
         try:
-            file_vars = dotenv_values(selected_env)  # type: ignore[assignment]
+            file_vars = load_env_values(selected_env)
         except Exception:
             file_vars = {}
         # Normalise keys for comparison
@@ -363,14 +381,13 @@ def send(
             custom_fields[key] = value
     # Expand environment variables in subject string
     from string import Template
-    from dotenv import dotenv_values
     import os
 
     mapping = dict(os.environ)
     # incorporate variables from env file for subject substitution
     if selected_env:
         try:
-            file_vars_for_subj = dotenv_values(selected_env)  # type: ignore[assignment]
+            file_vars_for_subj = load_env_values(selected_env)
             mapping.update(file_vars_for_subj)  # type: ignore[arg-type]
         except Exception:
             pass
@@ -8,22 +8,64 @@ overriding values from command-line options.
 
 from __future__ import annotations
 
+import functools
+import io
 import os
+import sys
+import weakref
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
-from dotenv import dotenv_values, load_dotenv
+# ``dataclass(slots=True)`` only supports weak references (needed by
+# ``_config_cache``) from Python 3.11 onwards via ``weakref_slot``.
+_DATACLASS_OPTIONS = (
+    {"slots": True, "weakref_slot": True} if sys.version_info >= (3, 11) else {}
+)
 
+# Configuration fields read from the .env file and the environment.
+_FIELDS = (
+    "host",
+    "port",
+    "user",
+    "password",
+    "sender",
+    "recipients",
+    "json_path",
+    "report_url",
+    "oauth_token",
+    "smtp_ssl",
+    "tenant_id",
+    "client_id",
+    "client_secret",
+    "from_address",
+)
 
-@dataclass
+# Fields that must be non-empty for each delivery mechanism.
+_REQUIRED_SMTP = ("host", "port", "user", "recipients")
+_REQUIRED_GRAPH = ("tenant_id", "client_id", "client_secret", "recipients")
+
+# Environment variable names for each field, in order of preference
+# (``AEMAILER_<KEY>`` then ``<KEY>``), computed once at import time.
+_ENV_KEYS = {f: (f"AEMAILER_{f.upper()}", f.upper()) for f in _FIELDS}
+_FIELD_UPPER_PAIRS = tuple(_ENV_KEYS.items())
+
+# Every environment variable name that may feed a configuration field.
+_ENV_NAMES = tuple(name for names in _ENV_KEYS.values() for name in names)
+
+# Configs already built from a given file, overrides and environment.
+# Entries disappear once nothing else references the ``Config``.
+_config_cache: "weakref.WeakValueDictionary[tuple, Config]" = weakref.WeakValueDictionary()
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class Config:
     """Runtime configuration for allure-emailer.
 
     Attributes correspond to environment variables defined in the
     generated configuration file.  All values except ``recipients`` and
     ``port`` are strings.  The ``recipients`` attribute contains a
-    list of email addresses split on commas.  The ``port`` attribute
+    tuple of email addresses split on commas.  The ``port`` attribute
     is converted to an integer.
 
     The ``sender`` field is optional.  If left empty or undefined, the
@@ -32,13 +74,17 @@ class Config:
     from the authentication username, which is typical for many SMTP
     providers.  Call :py:meth:`effective_sender` to obtain the final
     address used when sending email.
+
+    Instances are immutable and hashable.  ``recipients_header`` is
+    derived from ``recipients`` on construction and holds the
+    comma-separated value used for the ``To`` header.
     """
 
     host: str
     port: int
     user: str
     password: str
-    recipients: List[str] = field(default_factory=list)
+    recipients: Tuple[str, ...] = ()
     json_path: str = "allure-report/widgets/summary.json"
     report_url: str = ""
     sender: str = ""
@@ -49,6 +95,12 @@ class Config:
     # ``oauth_token`` is ``None`` or empty, password‑based
     # authentication is used.
     oauth_token: Optional[str] = None
+    # Force implicit TLS (``smtplib.SMTP_SSL``) regardless of the port.
+    # Port ``465`` always uses implicit TLS; this flag is for servers
+    # that offer it on a non-standard port.  Read from
+    # ``AEMAILER_SMTP_SSL`` and accepts ``1``, ``true``, ``yes`` or
+    # ``on`` (case-insensitive).
+    smtp_ssl: bool = False
 
     # Optional Microsoft Graph API credentials.  When all four of
     # ``tenant_id``, ``client_id``, ``client_secret`` and
@@ -63,6 +115,13 @@ class Config:
     client_secret: Optional[str] = None
     from_address: Optional[str] = None
 
+    recipients_header: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Join once here rather than on every send; the dataclass is
+        # frozen so the attribute has to be set through ``object``.
+        object.__setattr__(self, "recipients_header", ", ".join(self.recipients))
+
     @classmethod
     def from_env(
         cls,
@@ -71,14 +130,18 @@ class Config:
     ) -> "Config":
         """Load configuration from a .env file and process environment.
 
-        This method first loads the given ``env_file`` (if provided)
-        into the process environment using :func:`dotenv.load_dotenv`.
-        It then reads configuration keys from the environment and
-        applies any overrides passed via the ``overrides`` dictionary.
+        This method first reads the given ``env_file`` (if provided)
+        using :func:`load_env_values` without modifying the process
+        environment.  It then reads configuration keys from the
+        environment and applies any overrides passed via the
+        ``overrides`` dictionary.  Repeated calls with an unchanged
+        file, the same overrides and the same relevant environment
+        variables return the same (immutable) instance while it is
+        still referenced elsewhere.
         Environment variable names are expected to be uppercase
         versions of the field names: ``HOST``, ``PORT``, ``USER``,
-        ``PASSWORD``, ``SENDER``, ``RECIPIENTS``, ``JSON_PATH``, and
-        ``REPORT_URL``.
+        ``PASSWORD``, ``SENDER``, ``RECIPIENTS``, ``JSON_PATH``,
+        ``REPORT_URL`` and ``SMTP_SSL``.
 
         Parameters
         ----------
@@ -93,96 +156,84 @@ class Config:
         Config
             An instantiated configuration object.
         """
-        # Load configuration from the .env file (if provided) and from
-        # the process environment.  The values in the file take
-        # precedence over the environment variables of the same name to
-        # avoid collisions with system variables like ``USER``.  In
-        # addition, keys prefixed with ``AEMAILER_`` are preferred over
-        # their unprefixed counterparts to avoid clashing with other
-        # environment variables.  For example, ``AEMAILER_HOST`` will be
-        # used before ``HOST``.
-        file_vars: Dict[str, Optional[str]] = {}
-        if env_file is not None:
-            # ``dotenv_values`` reads key/value pairs from the file without
-            # altering ``os.environ``.  We normalise keys to uppercase
-            # later when merging.
-            file_vars = dotenv_values(env_file)  # type: ignore[assignment]
-
-        # Build a combined environment mapping where keys are
-        # uppercased.  Begin with the process environment and then
-        # overlay values from the file (file values override env vars).
-        combined: Dict[str, Optional[str]] = {k.upper(): v for k, v in os.environ.items()}
-        for k, v in file_vars.items():
-            # Normalise file keys to uppercase when merging
-            combined[k.upper()] = v
-
-        # Define the configuration fields we expect
-        fields = [
-            "host",
-            "port",
-            "user",
-            "password",
-            "sender",
-            "recipients",
-            "json_path",
-            "report_url",
-            "oauth_token",
-            "tenant_id",
-            "client_id",
-            "client_secret",
-            "from_address",
-        ]
-        # Extract values from the combined mapping, preferring
-        # ``AEMAILER_<KEY>`` over ``<KEY>``.  If neither is present the
-        # value remains ``None``.
+        # CLI overrides take the highest precedence.  Fields they supply
+        # are not looked up anywhere else, and when they supply every
+        # field neither the file nor the environment is consulted.
+        provided = {k: v for k, v in (overrides or {}).items() if v is not None}
+        lookup = not all(field_name in provided for field_name in _FIELDS)
+        cache_key = None
+        file_map: Dict[str, Optional[str]] = {}
+        if lookup:
+            # Return the instance built by an earlier call when the file
+            # is unchanged and the overrides and relevant environment
+            # variables are the same.
+            if env_file is not None:
+                signature = _stat_env_file(env_file)
+                if signature is not None:
+                    cache_key = (
+                        cls,
+                        *signature,
+                        frozenset(provided.items()),
+                        tuple(map(os.environ.get, _ENV_NAMES)),
+                    )
+                    cached = _config_cache.get(cache_key)
+                    if cached is not None:
+                        return cached
+
+                # The file is read without altering ``os.environ``.  Keys
+                # are normalised to uppercase so they match either way.
+                file_vars, cacheable = _read_env_file(signature)
+                if not cacheable:
+                    # ``${VAR}`` values depend on the whole environment
+                    cache_key = None
+                file_map = {k.upper(): v for k, v in file_vars.items()}
+
+        # Resolve every field in a single pass and note the empty ones
+        # for validation below.  The values in the file take precedence
+        # over environment variables of the same name to avoid
+        # collisions with system variables like ``USER``.  In addition,
+        # ``AEMAILER_<KEY>`` is preferred over ``<KEY>`` to avoid
+        # clashing with other environment variables.  For example,
+        # ``AEMAILER_HOST`` will be used before ``HOST``.  Only the
+        # variable names we need are looked up in ``os.environ``.
+        env = os.environ
         env_map: Dict[str, Optional[str]] = {}
-        for field_name in fields:
-            prefixed = f"AEMAILER_{field_name.upper()}"
-            unprefixed = field_name.upper()
-            if prefixed in combined:
-                env_map[field_name] = combined[prefixed]
-            elif unprefixed in combined:
-                env_map[field_name] = combined[unprefixed]
-            else:
-                env_map[field_name] = None
-
-        # Apply CLI overrides if provided (these take highest precedence)
-        if overrides:
-            for key, value in overrides.items():
-                if value is not None:
-                    env_map[key] = value
+        unset = set()
+        for field_name, names in _FIELD_UPPER_PAIRS:
+            value = provided.get(field_name)
+            if value is None and lookup:
+                for name in names:
+                    value = file_map[name] if name in file_map else env.get(name)
+                    if value is not None:
+                        break
+            if not value:
+                unset.add(field_name)
+            env_map[field_name] = value
 
         # Determine which authentication mechanism is configured.  If
         # ``tenant_id``, ``client_id`` and ``client_secret`` are all
         # present, assume the Microsoft Graph API will be used and
         # relax SMTP requirements.  Otherwise assume SMTP (password or
         # XOAUTH2) and require the usual fields.
-        missing: List[str] = []
-        using_graph = bool(
-            env_map.get("tenant_id") and env_map.get("client_id") and env_map.get("client_secret")
-        )
+        using_graph = unset.isdisjoint(("tenant_id", "client_id", "client_secret"))
         if using_graph:
             # Graph API mode: require tenant_id, client_id, client_secret and
             # recipients.  Also require at least one of from_address or user
-            for field_name in ["tenant_id", "client_id", "client_secret", "recipients"]:
-                if not env_map.get(field_name):
-                    missing.append(field_name)
-            if not (env_map.get("from_address") or env_map.get("user")):
+            missing = [f for f in _REQUIRED_GRAPH if f in unset]
+            if "from_address" in unset and "user" in unset:
                 missing.append("from_address/user")
             # Provide defaults for host/port/user if not supplied; they will
             # not be used but need to be set for type conversion below.
-            env_map["host"] = env_map.get("host") or ""
-            env_map["port"] = env_map.get("port") or "0"
+            env_map["host"] = env_map["host"] or ""
+            env_map["port"] = env_map["port"] or "0"
             # In Graph mode ignore system USER; prefer from_address or existing
-            env_map["user"] = env_map.get("from_address") or env_map.get("user") or ""
-            env_map["password"] = env_map.get("password") or None
+            env_map["user"] = env_map["from_address"] or env_map["user"] or ""
+            env_map["password"] = env_map["password"] or None
         else:
             # SMTP mode: require host, port, user, recipients
-            for field_name in ["host", "port", "user", "recipients"]:
-                if not env_map.get(field_name):
-                    missing.append(field_name)
+            missing = [f for f in _REQUIRED_SMTP if f in unset]
             # Require password when no OAuth token is provided
-            if not env_map.get("oauth_token") and not env_map.get("password"):
+            if "oauth_token" in unset and "password" in unset:
                 missing.append("password")
         if missing:
             raise ValueError(
@@ -196,35 +247,52 @@ class Config:
         except ValueError:
             raise ValueError(f"Invalid port value: {port_value}")
 
+        # Split and parse the recipients in one RFC 5322-aware call so a
+        # malformed address fails here rather than after the SMTP
+        # handshake.  Display names (``Dev <dev@example.com>``) are
+        # accepted and reduced to the bare address.  Blank entries such
+        # as a trailing comma are dropped first, so every remaining
+        # entry has to yield a valid address: ``getaddresses`` turns
+        # input it cannot parse (``a@b.com c@d.com``) into empty or
+        # partial addresses instead of raising.
+        from email.utils import getaddresses
+
         recipients_raw = env_map["recipients"] or ""
-        recipients_list = [addr.strip() for addr in recipients_raw.split(",") if addr.strip()]
+        cleaned = ",".join(chunk for chunk in recipients_raw.split(",") if chunk.strip())
+        recipients_list = [addr for _, addr in getaddresses([cleaned])] if cleaned else []
+        if not all(_is_valid_address(addr) for addr in recipients_list):
+            raise ValueError(f"Invalid recipient address(es) in RECIPIENTS: {recipients_raw}")
+        if not recipients_list:
+            raise ValueError("RECIPIENTS does not contain any email address")
 
-        # Ensure the SMTP username is a full email address (contains '@')
+        # Ensure the SMTP username is a full email address (contains '@').
+        # Only enforce email format for SMTP modes.
         user_val = env_map["user"]
-        # Only enforce email format for SMTP modes
-        using_graph_final = bool(
-            env_map.get("tenant_id") and env_map.get("client_id") and env_map.get("client_secret")
-        )
-        if not using_graph_final and "@" not in (user_val or ""):
+        if not using_graph and "@" not in (user_val or ""):
             raise ValueError(
                 "SMTP USER must be a full email address (e.g. contact@example.com)"
             )
 
-        return cls(
+        config = cls(
             host=env_map["host"],
             port=port_int,
             user=user_val,
             password=env_map["password"],
-            recipients=recipients_list,
+            recipients=tuple(recipients_list),
             json_path=env_map.get("json_path") or "allure-report/widgets/summary.json",
             report_url=env_map.get("report_url") or "",
             sender=env_map.get("sender") or "",
             oauth_token=env_map.get("oauth_token") or None,
+            smtp_ssl=(env_map.get("smtp_ssl") or "").strip().lower()
+            in ("1", "true", "yes", "on"),
             tenant_id=env_map.get("tenant_id") or None,
             client_id=env_map.get("client_id") or None,
             client_secret=env_map.get("client_secret") or None,
             from_address=env_map.get("from_address") or None,
         )
+        if cache_key is not None:
+            _config_cache[cache_key] = config
+        return config
 
     def effective_sender(self) -> str:
         """Return the email address used as the From header.
@@ -241,6 +309,141 @@ class Config:
         return self.sender or self.user
 
 
+def _parse_env(text: str) -> Dict[str, str]:
+    """Parse the contents of a .env file in a single pass over its lines.
+
+    Only the simple ``KEY=VALUE`` syntax written by ``init`` (and
+    commonly used by hand) is supported: blank lines and ``#``
+    comments are skipped, an optional leading ``export`` is ignored,
+    surrounding single or double quotes are removed from values and
+    values may carry a trailing `` # comment`` (after the closing
+    quote, if quoted).  Lines without ``=`` are ignored.
+    """
+    out: Dict[str, str] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export "):].lstrip()
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        value = value.strip()
+        quote = value[:1]
+        end = value.find(quote, 1) if quote in ("'", '"') else -1
+        while quote == '"' and end > 0 and value[end - 1] == "\\":
+            end = value.find(quote, end + 1)
+        if end > 0:
+            # Anything after the closing quote (e.g. `` # note``) is
+            # dropped; only ``\"`` is unescaped inside double quotes.
+            value = value[1:end]
+            if quote == '"':
+                value = value.replace('\\"', '"')
+        else:
+            value = value.split(" #", 1)[0].rstrip()
+        out[key.strip()] = value
+    return out
+
+
+def _is_valid_address(addr: str) -> bool:
+    """Return whether ``addr`` has exactly one ``@`` with text on both sides."""
+    local, sep, domain = addr.partition("@")
+    return bool(sep and local and domain) and "@" not in domain
+
+
+@functools.lru_cache(maxsize=32)
+def _load_env_map(
+    path: str, mtime_ns: int, size: int
+) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """Parse ``path`` and return its key/value pairs as a tuple.
+
+    ``mtime_ns`` and ``size`` are only used as part of the cache key so
+    that an edited file is parsed again instead of served stale.  The
+    built-in :func:`_parse_env` handles the plain syntax written by
+    ``init``; files containing ``${`` or a backslash escape are handed
+    to ``python-dotenv`` (when installed) for its interpolation and
+    escape rules.
+
+    Returns ``None`` when the file contains ``${...}`` references that
+    python-dotenv would expand from ``os.environ``: such a result
+    depends on more than the file and must not be cached.
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    if "${" not in text and "\\" not in text:
+        return tuple(_parse_env(text).items())
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        return tuple(_parse_env(text).items())
+    if "${" in text:
+        return None
+    return tuple(dotenv_values(stream=io.StringIO(text)).items())
+
+
+def _stat_env_file(env_file: Path | str) -> Optional[Tuple[str, int, int]]:
+    """Return ``(abspath, mtime_ns, size)`` for ``env_file``.
+
+    This is the cache key shared by :func:`_load_env_map` and
+    ``Config.from_env``.  Returns ``None`` when the file is missing.
+    """
+    path = os.path.abspath(os.fspath(env_file))
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def _read_env_file(
+    signature: Optional[Tuple[str, int, int]],
+) -> Tuple[Dict[str, Optional[str]], bool]:
+    """Return the values of a stat'ed env file and whether they may be cached.
+
+    ``signature`` comes from :func:`_stat_env_file`; ``None`` (a missing
+    file) yields an empty, cacheable mapping.
+    """
+    if signature is None:
+        return {}, True
+    pairs = _load_env_map(*signature)
+    if pairs is None:
+        from dotenv import dotenv_values
+
+        return dotenv_values(signature[0]), False
+    return dict(pairs), True
+
+
+def load_env_values(env_file: Path | str) -> Dict[str, Optional[str]]:
+    """Return the key/value pairs defined in a .env file.
+
+    Parsed results are cached per file, keyed by its modification time
+    and size, so repeated lookups of an unchanged file (for example
+    when the ``send`` command reads it for configuration, custom
+    fields and subject placeholders) avoid parsing it again.  Files
+    using ``${VAR}`` interpolation are parsed on every call because
+    their values depend on the environment.  A missing file yields an
+    empty mapping.
+
+    Parameters
+    ----------
+    env_file: Path | str
+        Path to the ``.env`` file.
+
+    Returns
+    -------
+    dict
+        Mapping of keys (as written in the file) to their values.
+    """
+    return _read_env_file(_stat_env_file(env_file))[0]
+
+
+def _prefixed_env_key(key: str) -> str:
+    """Return the ``AEMAILER_``-prefixed variable name for a field."""
+    if key in _ENV_KEYS:
+        return _ENV_KEYS[key][0]
+    return f"AEMAILER_{key.upper()}"
+
+
 def save_env_file(path: Path, config_dict: Dict[str, str]) -> None:
     """Write a set of configuration values to a .env file.
 
@@ -256,11 +459,29 @@ def save_env_file(path: Path, config_dict: Dict[str, str]) -> None:
         Path to the file that should be created or overwritten.
     config_dict: dict
         Mapping of field names (lowercase) to string values to
-        persist.
+        persist.  The file is written as UTF-8, matching how
+        :func:`load_env_values` reads it.
+
+    The file is replaced atomically and created with mode ``0600``
+    because it may contain passwords or client secrets.
     """
-    lines: List[str] = []
-    for key, value in config_dict.items():
-        env_key = f"AEMAILER_{key.upper()}"
-        lines.append(f"{env_key}={value}\n")
+    payload = "".join(
+        f"{_prefixed_env_key(key)}={value}\n" for key, value in config_dict.items()
+    ).encode("utf-8")
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text("".join(lines))
\ No newline at end of file
+    # Write to a sibling temporary file and rename it over ``path`` so
+    # readers never observe a partially written file.  The file holds
+    # SMTP credentials, so it is only readable by its owner.
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
\ No newline at end of file
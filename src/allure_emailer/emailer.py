@@ -2,22 +2,89 @@
 
 from __future__ import annotations
 
+import atexit
 import json
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import threading
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
 
 from .config import Config
 
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at runtime
+    import smtplib
+
+# ``smtplib``, ``email`` and ``requests`` are imported inside the
+# functions that send mail so that importing this module (for example
+# to call :func:`parse_summary`) stays cheap.
+
 try:
-    # ``requests`` is used for OAuth2 token acquisition and sending
-    # messages via the Microsoft Graph API.  It is declared as a
-    # dependency in pyproject.toml.
-    import requests  # type: ignore
+    # ``pysimdjson`` is optional.  Its parser returns lazy proxy objects
+    # so only the few statistic values we read are converted to Python
+    # objects, which matters for large ``summary.json`` files.
+    import simdjson  # type: ignore
 except ImportError:
-    requests = None  # will raise later if Graph API is used
+    simdjson = None  # fall back to ``_loads`` below
+
+try:
+    # ``orjson`` is optional and parses straight from bytes in C.  The
+    # standard library ``json.loads`` also accepts UTF-8 bytes, so both
+    # can be fed the raw file contents without decoding them first.
+    import orjson  # type: ignore
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Summaries larger than this many bytes are streamed with ``ijson``
+# (when installed) instead of being read into memory in full.
+_STREAM_THRESHOLD = 1024 * 1024
+
+# Layout of the summary email.  Built once at import time and filled in
+# with a single ``str.format`` call by :func:`build_html_email`.
+_HTML_TEMPLATE = (
+    """
+<html>
+  <body style="font-family: Arial, sans-serif;">
+    <h2>Allure Test Report Summary</h2>
+    <table border="0" cellpadding="6" cellspacing="0">
+      """
+    "<tr><td><strong>Total</strong></td><td>{total}</td></tr>"
+    "<tr><td><strong>Passed</strong></td><td style='color: #28a745;'>{passed}</td></tr>"
+    "<tr><td><strong>Failed</strong></td><td style='color: #dc3545;'>{failed}</td></tr>"
+    "<tr><td><strong>Broken</strong></td><td style='color: #ffc107;'>{broken}</td></tr>"
+    "<tr><td><strong>Skipped</strong></td><td style='color: #6c757d;'>{skipped}</td></tr>"
+    """
+    </table>
+    {custom_html}
+    {link_html}
+  </body>
+</html>
+"""
+)
+
+
+def _stream_statistic(summary_path: Path) -> Optional[Dict[str, object]]:
+    """Read the top-level ``statistic`` object of a summary incrementally.
+
+    Parsing stops as soon as the ``statistic`` object has been read, so
+    history and per-suite data after it are never loaded.  Returns
+    ``None`` when ``ijson`` is not installed.
+    """
+    try:
+        import ijson  # type: ignore
+    except ImportError:
+        return None
+    stats: Dict[str, object] = {}
+    with summary_path.open("rb") as fh:
+        for prefix, event, value in ijson.parse(fh):
+            if prefix == "statistic":
+                if event == "end_map":
+                    break
+            elif prefix.startswith("statistic.") and event in ("number", "string"):
+                key = prefix[len("statistic."):]
+                if "." not in key:
+                    stats[key] = value
+    return stats
 
 
 def parse_summary(path: Path | str) -> Dict[str, int]:
@@ -27,7 +94,12 @@ def parse_summary(path: Path | str) -> Dict[str, int]:
     ``widgets/`` containing various metadata about the run.  This
     function loads the file and returns a dictionary with keys
     ``total``, ``passed``, ``failed``, ``broken`` and ``skipped``.  If
-    any field is missing it defaults to ``0``.
+    any field is missing it defaults to ``0``.  Files larger than
+    ``_STREAM_THRESHOLD`` are streamed with ``ijson`` when it is
+    installed.  Otherwise, when ``pysimdjson`` is installed it is used
+    to parse the file lazily; failing that the bytes are parsed with
+    ``orjson`` if available, falling back to the standard library
+    ``json`` module.
 
     Parameters
     ----------
@@ -42,8 +114,17 @@ def parse_summary(path: Path | str) -> Dict[str, int]:
     summary_path = Path(path)
     if not summary_path.is_file():
         raise FileNotFoundError(f"Allure summary JSON not found: {summary_path}")
-    data = json.loads(summary_path.read_text())
-    stats = data.get("statistic", {})
+    stats = None
+    if summary_path.stat().st_size > _STREAM_THRESHOLD:
+        stats = _stream_statistic(summary_path)
+    if stats is None:
+        raw = summary_path.read_bytes()
+        if simdjson is not None:
+            # Keep the document alive while its proxies are being read
+            doc = simdjson.Parser().parse(raw)
+            stats = doc.get("statistic", {})
+        else:
+            stats = _loads(raw).get("statistic", {})
     return {
         "total": int(stats.get("total", 0)),
         "passed": int(stats.get("passed", 0)),
@@ -84,13 +165,6 @@ def build_html_email(
     str
         A string of HTML ready to be sent in an email.
     """
-    table_rows = (
-        f"<tr><td><strong>Total</strong></td><td>{stats['total']}</td></tr>"
-        f"<tr><td><strong>Passed</strong></td><td style='color: #28a745;'>{stats['passed']}</td></tr>"
-        f"<tr><td><strong>Failed</strong></td><td style='color: #dc3545;'>{stats['failed']}</td></tr>"
-        f"<tr><td><strong>Broken</strong></td><td style='color: #ffc107;'>{stats['broken']}</td></tr>"
-        f"<tr><td><strong>Skipped</strong></td><td style='color: #6c757d;'>{stats['skipped']}</td></tr>"
-    )
     link_html = (
         f"<p>You can view the full report <a href='{report_url}'>here</a>.</p>"
         if report_url
@@ -104,32 +178,144 @@ def build_html_email(
             for key, value in custom_fields.items()
         )
         custom_html = f"<h3>Additional Information</h3><table border='0' cellpadding='6' cellspacing='0'>{rows}</table>"
-    html = f"""
-<html>
-  <body style="font-family: Arial, sans-serif;">
-    <h2>Allure Test Report Summary</h2>
-    <table border="0" cellpadding="6" cellspacing="0">
-      {table_rows}
-    </table>
-    {custom_html}
-    {link_html}
-  </body>
-</html>
-"""
-    return html
+    return _HTML_TEMPLATE.format(
+        total=stats["total"],
+        passed=stats["passed"],
+        failed=stats["failed"],
+        broken=stats["broken"],
+        skipped=stats["skipped"],
+        custom_html=custom_html,
+        link_html=link_html,
+    )
+
+
+# Authenticated SMTP connections reused across ``send_email`` calls so
+# that sending several summaries in one process pays for the TLS
+# handshake and login only once per server and user.  Connections are
+# closed when the interpreter exits.
+_smtp_pool: Dict[Tuple[str, int, str, bool], "smtplib.SMTP"] = {}
+
+# One lock per pool key.  A pooled connection is only used while its
+# lock is held so concurrent senders never interleave SMTP commands on
+# the same socket.
+_smtp_locks: Dict[Tuple[str, int, str, bool], threading.Lock] = {}
+_smtp_locks_guard = threading.Lock()
+
+
+def _smtp_key(config: Config) -> Tuple[str, int, str, bool]:
+    # Include the TLS mode so ``smtp_ssl`` changes never reuse a
+    # connection opened the other way.
+    return (config.host, config.port, config.user, _uses_implicit_tls(config))
+
+
+def _uses_implicit_tls(config: Config) -> bool:
+    return config.port == 465 or config.smtp_ssl
+
+
+def _smtp_lock(key: Tuple[str, int, str, bool]) -> threading.Lock:
+    with _smtp_locks_guard:
+        return _smtp_locks.setdefault(key, threading.Lock())
+
+
+def _connect_smtp(config: Config) -> smtplib.SMTP:
+    """Open an SMTP connection and authenticate it.
+
+    Port ``465`` (or any port when ``config.smtp_ssl`` is set) uses
+    implicit TLS via :class:`smtplib.SMTP_SSL`, saving the extra
+    STARTTLS round-trips; any other port is upgraded with
+    ``starttls()``.  Authentication uses
+    XOAUTH2 when an OAuth token is configured and the password
+    otherwise.
+    """
+    import smtplib
+
+    # Determine whether to use SSL implicitly or to start TLS after connecting.
+    use_ssl = _uses_implicit_tls(config)
+    # Choose appropriate SMTP class
+    SMTPClass = smtplib.SMTP_SSL if use_ssl else smtplib.SMTP
+    server = SMTPClass(config.host, config.port)
+    try:
+        # For explicit TLS, upgrade the connection before authenticating
+        if not use_ssl:
+            server.starttls()
+        # If an OAuth2 token is provided, authenticate using XOAUTH2
+        if getattr(config, "oauth_token", None):
+            import base64
+            # Compose the SASL XOAUTH2 initial client response.  Use \x01
+            # (Control+A) as field separators as required by the protocol.
+            auth_string = f"user={config.user}\x01auth=Bearer {config.oauth_token}\x01\x01"
+            b64_auth = base64.b64encode(auth_string.encode("ascii")).decode("ascii")
+            # Issue the AUTH XOAUTH2 command
+            server.ehlo()
+            code, response = server.docmd("AUTH", "XOAUTH2 " + b64_auth)
+            # Check for success (2xx code).  Gmail returns 235 on success.
+            if code // 100 != 2:
+                raise smtplib.SMTPAuthenticationError(code, response)
+        else:
+            # Password-based authentication
+            server.login(config.user, config.password)
+    except BaseException:
+        server.close()
+        raise
+    return server
+
+
+def _get_smtp(config: Config) -> smtplib.SMTP:
+    """Return a pooled, authenticated SMTP connection for ``config``.
+
+    A cached connection is checked with ``NOOP`` before reuse; if the
+    server has dropped it a new connection is opened in its place.  The
+    caller must hold the key's lock from :func:`_smtp_lock` for as long
+    as it uses the returned connection.
+    """
+    import smtplib
+
+    key = _smtp_key(config)
+    server = _smtp_pool.get(key)
+    if server is not None:
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        del _smtp_pool[key]
+        server.close()
+    server = _connect_smtp(config)
+    _smtp_pool[key] = server
+    return server
+
+
+def _close_smtp_pool() -> None:
+    """Politely close every pooled SMTP connection."""
+    if not _smtp_pool:
+        return
+    import smtplib
+
+    for server in list(_smtp_pool.values()):
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    _smtp_pool.clear()
+
+
+atexit.register(_close_smtp_pool)
 
 
 def send_email(config: Config, html: str, subject: str = "Allure Test Summary") -> None:
     """Send an HTML email with the given subject and content.
 
-    This function creates a ``MIMEMultipart`` message with only an
-    HTML part (no plain text) and sends it via the SMTP server defined
-    in the provided configuration.  When connecting on port ``465`` it
-    uses :class:`smtplib.SMTP_SSL` (implicit TLS) and otherwise
-    performs an explicit TLS upgrade using ``starttls()`` (commonly
-    used with port ``587``).  The sender (``From``) address defaults
+    This function creates an :class:`email.message.EmailMessage` with
+    only an HTML body (no plain text) and sends it via the SMTP server defined
+    in the provided configuration.  When connecting on port ``465``
+    (or when ``smtp_ssl`` is enabled) it uses
+    :class:`smtplib.SMTP_SSL` (implicit TLS) and otherwise performs an
+    explicit TLS upgrade using ``starttls()`` (commonly used with port
+    ``587``).  The sender (``From``) address defaults
     to the SMTP ``user`` unless a specific sender was provided via
-    configuration or command‑line override.
+    configuration or command‑line override.  SMTP connections are
+    kept open and reused by later calls for the same host, port, user
+    and TLS mode.
 
     Parameters
     ----------
@@ -154,7 +340,12 @@ def send_email(config: Config, html: str, subject: str = "Allure Test Summary")
     from_addr = config.from_address or config.user
 
     if use_graph:
-        if requests is None:
+        try:
+            # ``requests`` is used for OAuth2 token acquisition and
+            # sending messages via the Microsoft Graph API.  It is
+            # declared as a dependency in pyproject.toml.
+            import requests  # type: ignore
+        except ImportError:
             raise RuntimeError(
                 "The 'requests' library is required for sending mail via the Microsoft Graph API"
             )
@@ -216,37 +407,29 @@ def send_email(config: Config, html: str, subject: str = "Allure Test Summary")
         return  # Successfully sent via Graph API
 
     # Fallback to SMTP if Graph is not used
-    # Create message container
-    message = MIMEMultipart("alternative")
+    import smtplib
+    from email.message import EmailMessage
+
+    # Create a single-part HTML message
+    message = EmailMessage()
     message["Subject"] = subject
     message["From"] = config.effective_sender()
-    message["To"] = ", ".join(config.recipients)
-    message.attach(MIMEText(html, "html"))
-    # Determine whether to use SSL implicitly or to start TLS after connecting.
-    use_ssl = config.port == 465
-    # Choose appropriate SMTP class
-    SMTPClass = smtplib.SMTP_SSL if use_ssl else smtplib.SMTP
-    with SMTPClass(config.host, config.port) as server:
-        # For explicit TLS, upgrade the connection before authenticating
-        if not use_ssl:
-            server.starttls()
-        # If an OAuth2 token is provided, authenticate using XOAUTH2
-        if getattr(config, "oauth_token", None):
-            import base64
-            # Compose the SASL XOAUTH2 initial client response.  Use \x01
-            # (Control+A) as field separators as required by the protocol.
-            auth_string = f"user={config.user}\x01auth=Bearer {config.oauth_token}\x01\x01"
-            b64_auth = base64.b64encode(auth_string.encode("ascii")).decode("ascii")
-            # Issue the AUTH XOAUTH2 command
-            server.ehlo()
-            code, response = server.docmd("AUTH", "XOAUTH2 " + b64_auth)
-            # Check for success (2xx code).  Gmail returns 235 on success.
-            if code // 100 != 2:
-                raise smtplib.SMTPAuthenticationError(code, response)
-        else:
-            # Password-based authentication
-            server.login(config.user, config.password)
-        # Send the email
-        server.sendmail(
-            config.effective_sender(), config.recipients, message.as_string()
-        )
\ No newline at end of file
+    message["To"] = config.recipients_header
+    message.set_content(html, subtype="html")
+    key = _smtp_key(config)
+    with _smtp_lock(key):
+        server = _get_smtp(config)
+        try:
+            # ``send_message`` serialises the message straight to bytes
+            server.send_message(
+                message, config.effective_sender(), config.recipients
+            )
+        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused):
+            # smtplib has already sent RSET, so the connection is usable
+            raise
+        except BaseException:
+            # The connection may be dead or mid-transaction with a late
+            # reply pending; never hand it out again.
+            _smtp_pool.pop(key, None)
+            server.close()
+            raise
@@ -1,13 +1,21 @@
 """Unit tests for the core functionality of allure-emailer."""
 
+import dataclasses
 import json
 import os
+import smtplib
+import sys
+import threading
+import time
+from decimal import Decimal
 from pathlib import Path
 
 import pytest
 
-from allure_emailer.config import Config
-from allure_emailer.emailer import build_html_email, parse_summary
+from allure_emailer.config import Config, _parse_env, load_env_values, save_env_file
+from allure_emailer import config as config_module
+from allure_emailer import emailer
+from allure_emailer.emailer import build_html_email, parse_summary, send_email
 
 
 def test_parse_summary(tmp_path: Path) -> None:
@@ -27,6 +35,52 @@ def test_parse_summary(tmp_path: Path) -> None:
     assert stats == {"total": 10, "passed": 8, "failed": 1, "broken": 1, "skipped": 0}
 
 
+def test_parse_summary_simdjson(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The pysimdjson path should return the same counts as the json one."""
+    simdjson = pytest.importorskip("simdjson")
+    monkeypatch.setattr(emailer, "simdjson", simdjson)
+
+    def fail(raw: bytes) -> None:
+        raise AssertionError("fallback parser used instead of simdjson")
+
+    monkeypatch.setattr(emailer, "_loads", fail)
+    summary_path = tmp_path / "summary.json"
+    summary_path.write_text(
+        json.dumps({"statistic": {"total": 3, "passed": 2, "failed": "1"}, "items": [1, 2]})
+    )
+    assert parse_summary(summary_path) == {
+        "total": 3, "passed": 2, "failed": 1, "broken": 0, "skipped": 0
+    }
+    summary_path.write_text(json.dumps({"reportName": "empty"}))
+    assert parse_summary(summary_path) == {
+        "total": 0, "passed": 0, "failed": 0, "broken": 0, "skipped": 0
+    }
+
+
+def test_parse_summary_from_bytes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without simdjson the raw bytes should go to the orjson/json loader."""
+    monkeypatch.setattr(emailer, "simdjson", None)
+    seen: list = []
+    loads = emailer._loads
+
+    def recording_loads(raw: bytes) -> dict:
+        seen.append(type(raw))
+        return loads(raw)
+
+    monkeypatch.setattr(emailer, "_loads", recording_loads)
+    summary_path = tmp_path / "summary.json"
+    summary_path.write_bytes(
+        json.dumps(
+            {"name": "caf\u00e9", "statistic": {"total": 4, "passed": 3, "skipped": 1}},
+            ensure_ascii=False,
+        ).encode("utf-8")
+    )
+    assert parse_summary(summary_path) == {
+        "total": 4, "passed": 3, "failed": 0, "broken": 0, "skipped": 1
+    }
+    assert seen == [bytes]
+
+
 def test_build_html_email() -> None:
     """The HTML builder should include counts and link correctly."""
     stats = {"total": 5, "passed": 4, "failed": 1, "broken": 0, "skipped": 0}
@@ -84,7 +138,8 @@ def test_config_from_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Non
     assert cfg.user == "ci@example.com"
     assert cfg.password == "secret"
     assert cfg.sender == "ci@test.com"
-    assert cfg.recipients == ["dev1@test.com", "dev2@test.com"]
+    assert cfg.recipients == ("dev1@test.com", "dev2@test.com")
+    assert cfg.recipients_header == "dev1@test.com, dev2@test.com"
     assert cfg.json_path == "report/summary.json"
     assert cfg.report_url == "https://example.com/report"
     # Apply overrides
@@ -92,7 +147,10 @@ def test_config_from_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Non
     cfg2 = Config.from_env(env_file, overrides=overrides)
     assert cfg2.host == "smtp.override"
     assert cfg2.port == 587
-    assert cfg2.recipients == ["user@acme.com"]
+    assert cfg2.recipients == ("user@acme.com",)
+    # Unchanged inputs reuse the cached instance; new overrides do not
+    assert Config.from_env(env_file) is cfg
+    assert Config.from_env(env_file, overrides=overrides) is cfg2
 
 
 def test_effective_sender_default(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -132,4 +190,293 @@ def test_effective_sender_default(tmp_path: Path, monkeypatch: pytest.MonkeyPatc
     cfg = Config.from_env(env_file)
     assert cfg.sender == ""
     # effective_sender should use the USER when sender is missing
-    assert cfg.effective_sender() == "ci@example.com"
\ No newline at end of file
+    assert cfg.effective_sender() == "ci@example.com"
+
+
+def test_load_env_values_reparses_changed_file(tmp_path: Path) -> None:
+    """Cached .env values should be refreshed when the file changes."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("AEMAILER_HOST=smtp.one.com\n")
+    assert load_env_values(env_file) == {"AEMAILER_HOST": "smtp.one.com"}
+    env_file.write_text("AEMAILER_HOST=smtp.second.com\n")
+    assert load_env_values(env_file) == {"AEMAILER_HOST": "smtp.second.com"}
+    assert load_env_values(tmp_path / "missing.env") == {}
+
+
+def test_load_env_values_syntax(tmp_path: Path) -> None:
+    """Comments, ``export`` prefixes and quotes should be handled."""
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "\n".join([
+            "# comment",
+            "",
+            "export AEMAILER_HOST=smtp.test.com",
+            "AEMAILER_PASSWORD='p#ss word'",
+            'AEMAILER_SENDER="ci@test.com"',
+            "AEMAILER_PORT=587 # submission",
+            "AEMAILER_REPORT_URL=https://example.com/a=b",
+            'AEMAILER_OAUTH_TOKEN="abc" # note',
+            'AEMAILER_CLIENT_SECRET="a\\"b#c"',
+        ])
+    )
+    expected = {
+        "AEMAILER_HOST": "smtp.test.com",
+        "AEMAILER_PASSWORD": "p#ss word",
+        "AEMAILER_SENDER": "ci@test.com",
+        "AEMAILER_PORT": "587",
+        "AEMAILER_REPORT_URL": "https://example.com/a=b",
+        "AEMAILER_OAUTH_TOKEN": "abc",
+        "AEMAILER_CLIENT_SECRET": 'a"b#c',
+    }
+    # The built-in parser must agree with python-dotenv on this syntax
+    assert _parse_env(env_file.read_text()) == expected
+    assert load_env_values(env_file) == expected
+
+
+def test_load_env_values_skips_dotenv_for_plain_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """python-dotenv should only be imported for ``${`` or escapes."""
+    monkeypatch.setitem(sys.modules, "dotenv", None)
+    env_file = tmp_path / ".env"
+    env_file.write_text('AEMAILER_HOST=smtp.test.com\nAEMAILER_PASSWORD="a b" # note\n')
+    assert load_env_values(env_file) == {
+        "AEMAILER_HOST": "smtp.test.com",
+        "AEMAILER_PASSWORD": "a b",
+    }
+
+
+def test_load_env_values_interpolation(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """``${VAR}`` references should follow the current environment."""
+    pytest.importorskip("dotenv")
+    env_file = tmp_path / ".env"
+    env_file.write_text("AEMAILER_REPORT_URL=https://ci.example.com/${BUILD_ID}\n")
+    monkeypatch.setenv("BUILD_ID", "1")
+    assert load_env_values(env_file) == {"AEMAILER_REPORT_URL": "https://ci.example.com/1"}
+    monkeypatch.setenv("BUILD_ID", "2")
+    assert load_env_values(env_file) == {"AEMAILER_REPORT_URL": "https://ci.example.com/2"}
+
+
+class FakeSMTP:
+    """Minimal stand-in for :class:`smtplib.SMTP` recording its use."""
+
+    instances: list = []
+
+    def __init__(self, host: str, port: int) -> None:
+        self.sent: list = []
+        FakeSMTP.instances.append(self)
+
+    def starttls(self) -> None:
+        pass
+
+    def login(self, user: str, password: str) -> None:
+        pass
+
+    def noop(self) -> tuple:
+        return (250, b"OK")
+
+    def send_message(self, msg, sender: str, recipients: list) -> None:
+        # Fail if another thread is using this connection at the same time
+        assert not getattr(self, "busy", False), "SMTP connection used concurrently"
+        self.busy = True
+        time.sleep(0.01)
+        self.sent.append((sender, list(recipients), msg))
+        self.busy = False
+
+    def quit(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def test_send_email_reuses_smtp_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Consecutive SMTP sends for the same server should share a connection."""
+    FakeSMTP.instances = []
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(emailer, "_smtp_pool", {})
+    cfg = Config(
+        host="smtp.test.com",
+        port=587,
+        user="ci@example.com",
+        password="secret",
+        recipients=("dev@example.com",),
+    )
+    send_email(cfg, "<p>one</p>")
+    send_email(cfg, "<p>two</p>")
+    assert len(FakeSMTP.instances) == 1
+    sent = FakeSMTP.instances[0].sent
+    assert len(sent) == 2
+    assert sent[0][:2] == ("ci@example.com", ["dev@example.com"])
+    # Switching to implicit TLS must not reuse the STARTTLS connection
+    monkeypatch.setattr(smtplib, "SMTP_SSL", FakeSMTP)
+    send_email(dataclasses.replace(cfg, smtp_ssl=True), "<p>three</p>")
+    assert len(FakeSMTP.instances) == 2
+    assert len(sent) == 2
+    message = sent[1][2]
+    assert message["To"] == "dev@example.com"
+    assert message.get_content_type() == "text/html"
+    assert "<p>two</p>" in message.get_content()
+
+
+def test_config_from_overrides_only(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Overrides covering every field should skip the .env file and environment."""
+    overrides = {
+        "host": "smtp.test.com",
+        "port": "465",
+        "user": "ci@example.com",
+        "password": "secret",
+        "sender": "",
+        "recipients": "dev@example.com",
+        "json_path": "summary.json",
+        "report_url": "",
+        "oauth_token": "",
+        "smtp_ssl": "false",
+        "tenant_id": "",
+        "client_id": "",
+        "client_secret": "",
+        "from_address": "",
+    }
+    env_file = tmp_path / ".env"
+    env_file.write_text("AEMAILER_HOST=smtp.file.com\nAEMAILER_PORT=25\n")
+    monkeypatch.setenv("AEMAILER_HOST", "smtp.env.com")
+
+    def fail(*args: object) -> None:
+        raise AssertionError("configuration file read despite full overrides")
+
+    monkeypatch.setattr(config_module, "_read_env_file", fail)
+    monkeypatch.setattr(config_module, "_stat_env_file", fail)
+    cfg = Config.from_env(env_file, overrides=overrides)
+    assert cfg.host == "smtp.test.com"
+    assert cfg.port == 465
+    assert cfg.recipients == ("dev@example.com",)
+    assert cfg.oauth_token is None
+
+
+def test_save_env_file_round_trip(tmp_path: Path) -> None:
+    """Values written by save_env_file should be read back with the prefix."""
+    env_file = tmp_path / "nested" / ".env"
+    save_env_file(env_file, {"host": "smtp.test.com", "recipients": "a@b.com,c@d.com"})
+    assert load_env_values(env_file) == {
+        "AEMAILER_HOST": "smtp.test.com",
+        "AEMAILER_RECIPIENTS": "a@b.com,c@d.com",
+    }
+    assert [p.name for p in env_file.parent.iterdir()] == [".env"]
+    if os.name == "posix":
+        assert env_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_config_rejects_invalid_recipients() -> None:
+    """Malformed recipient addresses should fail when loading the config."""
+    overrides = {
+        "host": "smtp.test.com",
+        "port": "587",
+        "user": "ci@example.com",
+        "password": "secret",
+    }
+    cfg = Config.from_env(
+        None, overrides={**overrides, "recipients": " a@b.com, Dev <c@d.com> ,"}
+    )
+    assert cfg.recipients == ("a@b.com", "c@d.com")
+    cfg = Config.from_env(
+        None, overrides={**overrides, "recipients": '"Doe, J" <j@x.com>, k@y.com'}
+    )
+    assert cfg.recipients == ("j@x.com", "k@y.com")
+    for bad in [
+        "a@b.com,not-an-address",
+        # space instead of comma must not silently lose ``a@b.com``
+        "a@b.com c@d.com",
+        "a@@b",
+        "@d.com",
+        "a@",
+        " , ",
+    ]:
+        with pytest.raises(ValueError):
+            Config.from_env(None, overrides={**overrides, "recipients": bad})
+
+
+def test_parse_summary_large_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Summaries above the streaming threshold should parse with or without ijson."""
+    monkeypatch.setattr(emailer, "_STREAM_THRESHOLD", 0)
+    data = {
+        "reportName": "Allure Report",
+        "statistic": {"failed": 2, "broken": 0, "skipped": 1, "passed": 7, "unknown": 0, "total": 10},
+        "time": {"start": 1, "stop": 2, "duration": 1},
+        "items": [{"statistic": {"total": 99}}] * 50,
+    }
+    summary_path = tmp_path / "summary.json"
+    summary_path.write_text(json.dumps(data))
+    stats = parse_summary(summary_path)
+    assert stats == {"total": 10, "passed": 7, "failed": 2, "broken": 0, "skipped": 1}
+
+
+def test_stream_statistic(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The ijson reader should stop after ``statistic`` and keep its values."""
+    pytest.importorskip("ijson")
+    summary_path = tmp_path / "summary.json"
+    # Everything after the statistic object is invalid JSON on purpose:
+    # streaming must stop before reaching it.
+    summary_path.write_text(
+        '{"reportName": "x", "statistic": {"total": 10.0, "passed": "7",'
+        ' "failed": 2, "nested": {"total": 99}}, "items": [GARBAGE'
+    )
+    stats = emailer._stream_statistic(summary_path)
+    assert stats == {"total": Decimal("10.0"), "passed": "7", "failed": 2}
+    monkeypatch.setattr(emailer, "_STREAM_THRESHOLD", 0)
+    assert parse_summary(summary_path) == {
+        "total": 10, "passed": 7, "failed": 2, "broken": 0, "skipped": 0
+    }
+
+
+def test_send_email_serialises_pooled_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Concurrent senders must not share a pooled connection at once."""
+    FakeSMTP.instances = []
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(emailer, "_smtp_pool", {})
+    cfg = Config(
+        host="smtp.test.com",
+        port=587,
+        user="ci@example.com",
+        password="secret",
+        recipients=("dev@example.com",),
+    )
+    errors: list = []
+
+    def worker() -> None:
+        try:
+            send_email(cfg, "<p>hi</p>")
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert sum(len(server.sent) for server in FakeSMTP.instances) == 4
+
+
+def test_send_email_evicts_connection_after_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A connection that failed mid-send must not be reused."""
+    FakeSMTP.instances = []
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(emailer, "_smtp_pool", {})
+    cfg = Config(
+        host="smtp.test.com",
+        port=587,
+        user="ci@example.com",
+        password="secret",
+        recipients=("dev@example.com",),
+    )
+
+    def timeout(*args: object) -> None:
+        raise TimeoutError("timed out")
+
+    send_email(cfg, "<p>one</p>")
+    monkeypatch.setattr(FakeSMTP.instances[0], "send_message", timeout)
+    with pytest.raises(TimeoutError):
+        send_email(cfg, "<p>two</p>")
+    assert emailer._smtp_pool == {}
+    send_email(cfg, "<p>three</p>")
+    assert len(FakeSMTP.instances) == 2